@@ -1,6 +1,26 @@
 # Import libraries to help with calculations
+import threading
 import numpy as np
-from scipy.stats import norm
+import numexpr as ne
+from scipy.special import ndtr
+import bs_kernels
+
+# Standard Normal Density Helper (1 / sqrt(2 * pi))
+_INV_SQRT_2PI = 0.3989422804014327
+
+def _npdf(x):
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+# The Kernels Run on Numba's Workqueue Threading Layer (Pinned in bs_kernels Unless NUMBA_THREADING_LAYER is Set), which is Not Thread-Safe,
+# so Kernel Launches are Serialized (The Kernels Already Use Every Core; the Lock Only Matters When
+# Callers Run from Worker Threads)
+_KERNEL_LOCK = threading.Lock()
+
+# Kernel Results are Cached on the Instance, so They are Handed Out Read-Only to Stop
+# In-Place Edits from Changing What Later Calls Return
+def _read_only(array):
+    array.flags.writeable = False
+    return array
 
 class BSM:
 
@@ -21,11 +41,60 @@ class BSM:
             The annualized standard deviation of the asset's returns (volatility).
         """
 
-        self.spot_price = spot_price
-        self.strike_price = strike_price
-        self.rf_rate = rf_rate
-        self.maturity_time = maturity_time
-        self.volatility = volatility
+        # Array Inputs are Evaluated by the Fused Numba Kernels on First Use
+        params = (spot_price, strike_price, rf_rate, maturity_time, volatility)
+        arrays = [p for p in params if isinstance(p, np.ndarray)]
+        self._vectorized = bool(arrays)
+
+        # Cast Scalar Parameters to the Precision of the Array Inputs (e.g. float32 Grids)
+        if self._vectorized:
+            self._dtype = np.result_type(*arrays, np.float32)
+            params = [p.astype(self._dtype, copy=False) if isinstance(p, np.ndarray) else self._dtype.type(p) for p in params]
+
+        self.spot_price, self.strike_price, self.rf_rate, self.maturity_time, self.volatility = params
+        self._prices = None
+        self._greeks = None
+        self._d1 = None
+
+        if not self._vectorized:
+            self._cache_terms()
+
+    # Cache Intermediate Terms Shared by the Prices and Greeks
+    def _cache_terms(self):
+        self._sqrtT = np.sqrt(self.maturity_time)
+        self._sigma_sqrtT = self.volatility * self._sqrtT
+        self._disc = np.exp(-self.rf_rate * self.maturity_time)
+        sigma2 = self.volatility * self.volatility
+        self._d1 = (np.log(self.spot_price / self.strike_price) + (self.rf_rate + 0.5 * sigma2) * self.maturity_time) / self._sigma_sqrtT
+        self._d2 = self._d1 - self._sigma_sqrtT
+
+    # Flatten and Broadcast the Inputs into Contiguous Arrays for the Kernels
+    def _kernel_inputs(self):
+        params = np.broadcast_arrays(self.spot_price, self.strike_price, self.rf_rate, self.maturity_time, self.volatility)
+        shape = params[0].shape
+        # Kernel Inputs are Always Read-Only Views, so Writable & Read-Only Arrays Share One Compiled Signature
+        return shape, [_read_only(np.ascontiguousarray(p, dtype=self._dtype).reshape(-1)) for p in params]
+
+    # Evaluate Call & Put Prices in One Kernel Pass
+    def _kernel_prices(self):
+        if self._prices is None:
+            shape, params = self._kernel_inputs()
+            outs = [np.empty_like(params[0]) for _ in range(2)]
+            with _KERNEL_LOCK:
+                bs_kernels.bs_call_put(*params, *outs)
+            self._prices = dict(zip(('call', 'put'), (_read_only(o.reshape(shape)) for o in outs)))
+        return self._prices
+
+    # Evaluate Every Greek in One Kernel Pass
+    def _kernel_greeks(self):
+        if self._greeks is None:
+            shape, params = self._kernel_inputs()
+            names = ('delta_call', 'delta_put', 'gamma', 'vega', 'theta_call', 'theta_put', 'rho_call', 'rho_put')
+            outs = [np.empty_like(params[0]) for _ in names]
+            with _KERNEL_LOCK:
+                bs_kernels.bs_greeks(*params, *outs)
+            self._greeks = dict(zip(names, (_read_only(o.reshape(shape)) for o in outs)))
+        return self._greeks
     
     # Calculate the Call Price
     def call_price(self):
@@ -38,13 +107,15 @@ class BSM:
             The theoretical price of a European call option.
         """
 
-        d_1 = (np.log(self.spot_price / self.strike_price) + (self.rf_rate + 0.5 * self.volatility ** 2) * self.maturity_time) / (self.volatility * np.sqrt(self.maturity_time))
-        d_2 = d_1 - self.volatility * np.sqrt(self.maturity_time)
+        if self._vectorized:
+            return self._kernel_prices()['call']
+
+        d_1, d_2 = self.d1_d2()
     
-        normed_d_1 = norm.cdf(d_1)
-        normed_d_2 = norm.cdf(d_2)
+        normed_d_1 = ndtr(d_1)
+        normed_d_2 = ndtr(d_2)
 
-        price = self.spot_price * normed_d_1 - self.strike_price * np.exp(-self.rf_rate * self.maturity_time) * normed_d_2
+        price = self.spot_price * normed_d_1 - self.strike_price * self._disc * normed_d_2
 
         return price
 
@@ -59,58 +130,133 @@ class BSM:
             The theoretical price of a European put option.
         """
 
-        d_1 = (np.log(self.spot_price / self.strike_price) + (self.rf_rate + 0.5 * self.volatility ** 2) * self.maturity_time) / (self.volatility * np.sqrt(self.maturity_time))
-        d_2 = d_1 - self.volatility * np.sqrt(self.maturity_time)
+        if self._vectorized:
+            return self._kernel_prices()['put']
+
+        d_1, d_2 = self.d1_d2()
         
-        normed_d_1 = norm.cdf(-d_1)
-        normed_d_2 = norm.cdf(-d_2)
+        normed_d_1 = ndtr(-d_1)
+        normed_d_2 = ndtr(-d_2)
 
-        price = self.strike_price * np.exp(-self.rf_rate * self.maturity_time) * normed_d_2 - self.spot_price * normed_d_1
+        price = self.strike_price * self._disc * normed_d_2 - self.spot_price * normed_d_1
 
         return price
+
+    # Price a Batch of Options and Their Greeks in One Vectorized Pass
+    @classmethod
+    def price_batch(cls, S, K, r, T, sigma):
+        """
+        Calculates prices and Greeks for many European options at once (e.g. the columns of a DataFrame).
+
+        Parameters
+        ----------
+        S, K, r, T, sigma : array_like
+            One-dimensional arrays of length N holding the spot prices, strike prices,
+            risk-free rates, maturities (in years) and volatilities of each option.
+
+        Returns
+        -------
+        call, put, delta_call, delta_put, gamma, vega, theta_call, theta_put, rho_call, rho_put : ndarray
+            Arrays of length N. Vega is reported per 1% change in volatility.
+        """
+
+        S, K, r, T, sigma = (np.asarray(p, dtype=np.float64) for p in (S, K, r, T, sigma))
+
+        # Shared Terms are Evaluated Exactly Once per Option
+        sqrtT = np.sqrt(T)
+        sigma_sqrtT = sigma * sqrtT
+        d1 = ne.evaluate("(log(S / K) + (r + 0.5 * sigma * sigma) * T) / sigma_sqrtT", local_dict={'S': S, 'K': K, 'r': r, 'T': T, 'sigma': sigma, 'sigma_sqrtT': sigma_sqrtT})
+        d2 = d1 - sigma_sqrtT
+        Nd1 = ndtr(d1)
+        Nd2 = ndtr(d2)
+        N_neg_d1 = ndtr(-d1)
+        N_neg_d2 = ndtr(-d2)
+        nd1 = _npdf(d1)
+        disc_K = K * np.exp(-r * T)
+
+        # The Price, Gamma, Vega, Theta & Rho Expressions are Each Evaluated by numexpr in One Blocked Pass (No Temporaries)
+        terms = {'S': S, 'r': r, 'T': T, 'sigma': sigma, 'sqrtT': sqrtT, 'sigma_sqrtT': sigma_sqrtT, 'disc_K': disc_K, 'nd1': nd1, 'Nd1': Nd1, 'Nd2': Nd2, 'N_neg_d1': N_neg_d1, 'N_neg_d2': N_neg_d2}
+        call = ne.evaluate("S * Nd1 - disc_K * Nd2", local_dict=terms)
+        put = ne.evaluate("disc_K * N_neg_d2 - S * N_neg_d1", local_dict=terms)
+        gamma = ne.evaluate("nd1 / (S * sigma_sqrtT)", local_dict=terms)
+        vega = ne.evaluate("(S * nd1 * sqrtT) / 100", local_dict=terms)  # Per 1% vol change
+        theta_call = ne.evaluate("-(S * nd1 * sigma) / (2 * sqrtT) - r * disc_K * Nd2", local_dict=terms)
+        theta_put = ne.evaluate("-(S * nd1 * sigma) / (2 * sqrtT) + r * disc_K * N_neg_d2", local_dict=terms)
+        rho_call = ne.evaluate("T * disc_K * Nd2", local_dict=terms)
+        rho_put = ne.evaluate("-T * disc_K * N_neg_d2", local_dict=terms)
+
+        return call, put, Nd1, Nd1 - 1, gamma, vega, theta_call, theta_put, rho_call, rho_put
     
     # Helper Methods to Compute d_1 and d_2
     def d1_d2(self):
-        d_1 = (np.log(self.spot_price / self.strike_price) + (self.rf_rate + 0.5 * self.volatility ** 2) * self.maturity_time) / (self.volatility * np.sqrt(self.maturity_time))
-        d_2 = d_1 - self.volatility * np.sqrt(self.maturity_time)
-        return d_1, d_2
+        if self._d1 is None:
+            self._cache_terms()
+        return self._d1, self._d2
 
     # Calculating the Greeks
     def delta_call(self):
+        if self._vectorized:
+            return self._kernel_greeks()['delta_call']
         d1, _ = self.d1_d2()
-        return norm.cdf(d1)
+        return ndtr(d1)
 
     def delta_put(self):
+        if self._vectorized:
+            return self._kernel_greeks()['delta_put']
         d1, _ = self.d1_d2()
-        return norm.cdf(d1) - 1
+        return ndtr(d1) - 1
 
     def gamma(self):
-        d1, _ = self.d1_d2()
-        return norm.pdf(d1) / (self.spot_price * self.volatility * np.sqrt(self.maturity_time))
+        if self._vectorized:
+            return self._kernel_greeks()['gamma']
+        # Single Expression Over the Cached d1 and sigma * sqrt(T) (No Recomputed Square Root)
+        return _INV_SQRT_2PI * np.exp(-0.5 * self._d1 * self._d1) / (self.spot_price * self._sigma_sqrtT)
 
 
     def vega(self):
+        if self._vectorized:
+            return self._kernel_greeks()['vega']
         d1, _ = self.d1_d2()
-        return (self.spot_price * norm.pdf(d1) * np.sqrt(self.maturity_time)) / 100  # Per 1% vol change
+        return (self.spot_price * _npdf(d1) * self._sqrtT) / 100  # Per 1% vol change
 
 
     def theta_call(self):
+        if self._vectorized:
+            return self._kernel_greeks()['theta_call']
         d1, d2 = self.d1_d2()
-        term1 = - (self.spot_price * norm.pdf(d1) * self.volatility) / (2 * np.sqrt(self.maturity_time))
-        term2 = - self.rf_rate * self.strike_price * np.exp(-self.rf_rate * self.maturity_time) * norm.cdf(d2)
+        term1 = - (self.spot_price * _npdf(d1) * self.volatility) / (2 * self._sqrtT)
+        term2 = - self.rf_rate * self.strike_price * self._disc * ndtr(d2)
         return term1 + term2
 
     def theta_put(self):
+        if self._vectorized:
+            return self._kernel_greeks()['theta_put']
         d1, d2 = self.d1_d2()
-        term1 = - (self.spot_price * norm.pdf(d1) * self.volatility) / (2 * np.sqrt(self.maturity_time))
-        term2 = self.rf_rate * self.strike_price * np.exp(-self.rf_rate * self.maturity_time) * norm.cdf(-d2)
+        term1 = - (self.spot_price * _npdf(d1) * self.volatility) / (2 * self._sqrtT)
+        term2 = self.rf_rate * self.strike_price * self._disc * ndtr(-d2)
         return term1 + term2
 
 
     def rho_call(self):
+        if self._vectorized:
+            return self._kernel_greeks()['rho_call']
         _, d2 = self.d1_d2()
-        return self.strike_price * self.maturity_time * np.exp(-self.rf_rate * self.maturity_time) * norm.cdf(d2)
+        return self.strike_price * self.maturity_time * self._disc * ndtr(d2)
 
     def rho_put(self):
+        if self._vectorized:
+            return self._kernel_greeks()['rho_put']
         _, d2 = self.d1_d2()
-        return -self.strike_price * self.maturity_time * np.exp(-self.rf_rate * self.maturity_time) * norm.cdf(-d2)
+        return -self.strike_price * self.maturity_time * self._disc * ndtr(-d2)
+
+# Compile (or Load from the On-Disk Cache) the Numba Kernels for the float32 & float64 Grids at Import,
+# so the First Dashboard Render Does Not Pay the JIT Latency (Safe on Streamlit's Script Thread Now the
+# Threading Layer is Pinned in bs_kernels); Inputs Reach the Kernels as Read-Only Views, so This Also Covers
+# the Dashboard's Read-Only Grids
+def warm_up_kernels():
+    for dtype in (np.float32, np.float64):
+        model = BSM(np.ones(2, dtype=dtype), 1.0, 0.01, 1.0, 0.2)
+        model.call_price()
+        model.delta_call()
+
+warm_up_kernels()
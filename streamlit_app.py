@@ -1,38 +1,150 @@
 # Import necessary libraries
 import streamlit as st 
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import norm
 import black_scholes_model as bsm
 import pandas as pd
 
-# call_price(spot_price, strike_price, rf_rate, maturity_time, volatility): reference
+# Grids are Built Once per Axis Range and Shared by Every Panel & Session Using that Axis Pair, so They are Made Read-Only
+@st.cache_resource(max_entries=32)
 def meshgrid(X_min, Y_min, X_max, Y_max):
-    X_range = np.linspace(X_min, X_max, 100)
-    Y_range = np.linspace(Y_min, Y_max, 100)
+    X_range = np.linspace(X_min, X_max, 100, dtype=np.float32)
+    Y_range = np.linspace(Y_min, Y_max, 100, dtype=np.float32)
     X, Y = np.meshgrid(X_range, Y_range)
+    X.flags.writeable = False
+    Y.flags.writeable = False
     return X, Y
 
+# Evaluate Every Greek of a Model in One Pass (Array Inputs Share a Single Kernel Evaluation)
+def greeks(model):
+    return {
+        'delta_call' : model.delta_call(),
+        'delta_put' : model.delta_put(),
+        'gamma' : model.gamma(),
+        'vega' : model.vega(),
+        'theta_call' : model.theta_call(),
+        'theta_put' : model.theta_put(),
+        'rho_call' : model.rho_call(),
+        'rho_put' : model.rho_put()
+    }
+
+# Worker Pool that Evaluates the Greek Surfaces Off the Script Thread (Shared by All Sessions)
+@st.cache_resource
+def executor():
+    return ThreadPoolExecutor(max_workers=3)
+
+# Futures Still Queued or Running on the Worker Pool (Across All Sessions)
+@st.cache_resource
+def pending():
+    return set()
+
+def submit(fn, *args):
+    future = executor().submit(fn, *args)
+    pending().add(future)
+    future.add_done_callback(pending().discard)
+    return future
+
+# Shared Greek Surfaces for Each (X-Axis, Y-Axis) Pair Used by the Heatmaps
+# (Each Call Submits the Evaluation to the Worker Pool; the Future is Cached so Later Reruns Reuse its Result)
+@st.cache_resource(max_entries=32)
+def spot_volatility_greeks(spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time):
+    X, Y = meshgrid(spot_price_min, volatility_min, spot_price_max, volatility_max)
+    return X, Y, submit(greeks, bsm.BSM(X, strike_price, rf_rate, maturity_time, Y))
+
+@st.cache_resource(max_entries=32)
+def spot_maturity_greeks(spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility):
+    X, Y = meshgrid(spot_price_min, maturity_time_min, spot_price_max, maturity_time_max)
+    return X, Y, submit(greeks, bsm.BSM(X, strike_price, rf_rate, Y, volatility))
+
+@st.cache_resource(max_entries=32)
+def spot_rate_greeks(spot_price_min, spot_price_max, rf_rate_min, rf_rate_max, strike_price, maturity_time, volatility):
+    X, Y = meshgrid(spot_price_min, rf_rate_min, spot_price_max, rf_rate_max)
+    return X, Y, submit(greeks, bsm.BSM(X, strike_price, Y, maturity_time, volatility))
+
+# Wait for a Cached Surface; a Failed Evaluation is Evicted and Resubmitted Instead of Re-Raising Forever
+def surface_result(builder, *args):
+    X, Y, future = builder(*args)
+    if future.exception() is not None:
+        builder.clear(*args)
+        X, Y, future = builder(*args)
+    return X, Y, future.result()
+
 def heatmap(X, Y, call_Z, put_Z, call_title, put_title, call_label, put_label, x_label, y_label):
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Raster the Grid Directly Rather than Tracing Contour Polygons
+    extent = [X.min(), X.max(), Y.min(), Y.max()]
     
     # Call Plot
-    call = ax1.contourf(X, Y, call_Z, cmap="viridis")
-    fig.colorbar(call, ax=ax1, label=call_label)
+    call = ax1.imshow(call_Z, extent=extent, origin="lower", aspect="auto", cmap="viridis", interpolation="bilinear")
+    call_bar = fig.colorbar(call, ax=ax1, label=call_label)
     ax1.set_title(call_title)
     ax1.set_xlabel(x_label)
     ax1.set_ylabel(y_label)
 
     # Put Plot
-    put = ax2.contourf(X, Y, put_Z, cmap="plasma")
-    fig.colorbar(put, ax=ax2, label=put_label)
+    put = ax2.imshow(put_Z, extent=extent, origin="lower", aspect="auto", cmap="plasma", interpolation="bilinear")
+    put_bar = fig.colorbar(put, ax=ax2, label=put_label)
     ax2.set_title(put_title)
     ax2.set_xlabel(x_label)
     ax2.set_ylabel(y_label)
 
     plt.tight_layout()
+
+    # Detach the Figure from Pyplot so Persistent Figures are Not Kept Open
+    plt.close(fig)
+    return fig, (call, put), (call_bar, put_bar)
+
+# Redraw an Existing Heatmap by Updating its Artists Instead of Rebuilding the Figure
+def update_heatmap(panel, X, Y, call_Z, put_Z):
+    fig, images, colorbars = panel
+    extent = [X.min(), X.max(), Y.min(), Y.max()]
+
+    for image, colorbar, Z in zip(images, colorbars, (call_Z, put_Z)):
+        image.set_data(Z)
+        image.set_extent(extent)
+
+        # Rescale the Colours the Way a Fresh imshow Does (NaN Cells, e.g. at Zero Maturity, are Ignored)
+        image.autoscale()
+        colorbar.update_normal(image)
+
     return fig
 
+# Each Panel's Figure, Images & Colorbars are Built Once per Session and Reused on Later Reruns
+def session_heatmap(key, X, Y, call_Z, put_Z, *labels):
+    if key not in st.session_state:
+        st.session_state[key] = heatmap(X, Y, call_Z, put_Z, *labels)
+        return st.session_state[key][0]
+    return update_heatmap(st.session_state[key], X, Y, call_Z, put_Z)
+
+# Heatmap Figures for Each Greek Panel (Surfaces are Cached; Figures Persist in Session State)
+def delta_fig(spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time):
+    X, Y, surfaces = surface_result(spot_volatility_greeks, spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time)
+    return session_heatmap("delta_heatmap", X, Y, surfaces['delta_call'], surfaces['delta_put'], "Call Option Delta Heatmap", "Put Option Delta Heatmap", "Call Delta", "Put Delta", "Spot Price", "Volatility")
+
+def gamma_fig(spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility):
+    X, Y, surfaces = surface_result(spot_maturity_greeks, spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility)
+
+    # Gamma is Identical for Calls & Puts, so One Surface Feeds Both Plots
+    call_gammas = put_gammas = surfaces['gamma']
+    return session_heatmap("gamma_heatmap", X, Y, call_gammas, put_gammas, "Call Option Gamma Heatmap", "Put Option Gamma Heatmap", "Call Gamma", "Put Gamma", "Spot Price", "Time to Maturity (years)")
+
+def theta_fig(spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility):
+    X, Y, surfaces = surface_result(spot_maturity_greeks, spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility)
+    return session_heatmap("theta_heatmap", X, Y, surfaces['theta_call'], surfaces['theta_put'], "Call Option Theta Heatmap", "Put Option Theta Heatmap", "Call Theta", "Put Theta", "Spot Price", "Time to Maturity (years)")
+
+def vega_fig(spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time):
+    X, Y, surfaces = surface_result(spot_volatility_greeks, spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time)
+
+    # Vega is Identical for Calls & Puts, so One Surface Feeds Both Plots
+    call_vegas = put_vegas = surfaces['vega']
+    return session_heatmap("vega_heatmap", X, Y, call_vegas, put_vegas, "Call Option Vega Heatmap", "Put Option Vega Heatmap", "Call Vega", "Put Vega", "Spot Price", "Volatility")
+
+def rho_fig(spot_price_min, spot_price_max, rf_rate_min, rf_rate_max, strike_price, maturity_time, volatility):
+    X, Y, surfaces = surface_result(spot_rate_greeks, spot_price_min, spot_price_max, rf_rate_min, rf_rate_max, strike_price, maturity_time, volatility)
+    return session_heatmap("rho_heatmap", X, Y, surfaces['rho_call'], surfaces['rho_put'], "Call Option Rho Heatmap", "Put Option Rho Heatmap", "Call Rho", "Put Rho", "Spot Price", "Risk-Free Interest Rate")
+
 # Streamlit Dashboard Configuration
 st.set_page_config(
     layout='wide',
@@ -100,8 +212,6 @@ with st.sidebar:
     maturity_time_min, maturity_time_max = st.slider("Time to Maturity Range", 0.01, 10.0, (0.01, 10.0))
     rf_rate_min, rf_rate_max = st.slider("Risk-Free Interest Rate Range", 0.01, 1.0, (0.01, 1.0))
 
-
-
 # Streamlit Dashboard
 st.title("A Visual Framework for Pricing and Sensitivity Analysis of European Options")
 
@@ -197,110 +307,70 @@ with col2:
 
 st.markdown("---")
 st.title("Modeling European Option Sensitivities in the Black-Scholes Framework")
-# -----
-# Delta:
-st.subheader("Δ (Delta): Sensitivity of the Option Price to Underlying Asset Movements")
-st.write("Delta quantifies the rate of change in an option's price with respect to changes in the underlying asset's price. It represents the first-order derivative of the option value and is a key measure of directional exposure.")
-st.markdown("---")
-
-# Create Meshgrid Object for Spot Prices & Volatilities
-X, Y = meshgrid(spot_price_min, volatility_min, spot_price_max, volatility_max)
 
-# Create a Model for Delta Sensitivies
-delta_model = bsm.BSM(X, strike_price, rf_rate, maturity_time, Y)
+# Select a Single Greek so Only its Heatmap is Computed & Rendered on Each Rerun
+greek = st.radio("Option Greek", ["Delta", "Gamma", "Theta", "Vega", "Rho"], horizontal=True, key="active_greek")
+st.markdown("---")
 
-# Calculate Call & Put Deltas
-call_deltas = delta_model.delta_call()
-put_deltas = delta_model.delta_put()
+# -----
+# Delta:
+if greek == "Delta":
+    st.subheader("Δ (Delta): Sensitivity of the Option Price to Underlying Asset Movements")
+    st.write("Delta quantifies the rate of change in an option's price with respect to changes in the underlying asset's price. It represents the first-order derivative of the option value and is a key measure of directional exposure.")
+    st.markdown("---")
 
-# Create Deltas Heatmap
-fig = heatmap(X, Y, call_deltas, put_deltas, "Call Option Delta Heatmap", "Put Option Delta Heatmap", "Call Delta", "Put Delta", "Spot Price", "Volatility")
-st.pyplot(fig)
+    # Create Deltas Heatmap
+    fig = delta_fig(spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time)
+    st.pyplot(fig, clear_figure=False)
 
-# Add Small Break Between Upper and Lower Parts
-st.markdown("---")
 # -----
 # Gamma:
-st.subheader("Γ (Gamma): Sensitivity of Delta to the Option Price")
-st.write("Gamma measures the rate of change of Delta with respect to the underlying asset's price. It reflects the curvature in the option's price profile and indicates how much the Delta will change as the underlying asset moves. High Gamma implies greater convexity and risk in Delta hedging.")
-st.markdown("---")
-
-# Create Meshgrid Object for Spot Prices & Volatilities
-X, Y = meshgrid(spot_price_min, maturity_time_min, spot_price_max, maturity_time_max)
-
-# Create a Model for Gammas Sensitivies
-gamma_model = bsm.BSM(X, strike_price, rf_rate, Y, volatility)
-
-# Calculate Call & Put Gammas
-call_gammas = gamma_model.gamma()
-put_gammas = gamma_model.gamma()
+elif greek == "Gamma":
+    st.subheader("Γ (Gamma): Sensitivity of Delta to the Option Price")
+    st.write("Gamma measures the rate of change of Delta with respect to the underlying asset's price. It reflects the curvature in the option's price profile and indicates how much the Delta will change as the underlying asset moves. High Gamma implies greater convexity and risk in Delta hedging.")
+    st.markdown("---")
 
-# Create Gammas Heatmap
-fig = heatmap(X, Y, call_gammas, put_gammas, "Call Option Gamma Heatmap", "Put Option Gamma Heatmap", "Call Gamma", "Put Gamma", "Spot Price", "Time to Maturity (years)")
-st.pyplot(fig)
+    # Create Gammas Heatmap
+    fig = gamma_fig(spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility)
+    st.pyplot(fig, clear_figure=False)
 
-# Add Small Break Between Upper and Lower Parts
-st.markdown("---")
 # -----
 # Theta:
-st.subheader("Θ (Theta): Sensitivity to Time Decay")
-st.write("Theta measures the rate at which an option’s value declines over time, holding other variables constant. It captures the impact of time decay and is typically negative for long options, reflecting the erosion of extrinsic value as expiration approaches.")
-st.markdown("---")
-
-# Create Meshgrid Object for Spot Prices & Vollities
-X, Y = meshgrid(spot_price_min, maturity_time_min, spot_price_max, maturity_time_max)
-
-# Create a Model for Theta Sensitivies
-theta_model = bsm.BSM(X, strike_price, rf_rate, Y, volatility)
-
-# Calculate Call & Put Thetas
-call_thetas = theta_model.theta_call()
-put_thetas = theta_model.theta_call()
+elif greek == "Theta":
+    st.subheader("Θ (Theta): Sensitivity to Time Decay")
+    st.write("Theta measures the rate at which an option’s value declines over time, holding other variables constant. It captures the impact of time decay and is typically negative for long options, reflecting the erosion of extrinsic value as expiration approaches.")
+    st.markdown("---")
 
-# Create Thetas Heatmap
-fig = heatmap(X, Y, call_thetas, put_thetas, "Call Option Theta Heatmap", "Put Option Theta Heatmap", "Call Theta", "Put Theta", "Spot Price", "Time to Maturity (years)")
-st.pyplot(fig)
+    # Create Thetas Heatmap
+    fig = theta_fig(spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility)
+    st.pyplot(fig, clear_figure=False)
 
-# Add Small Break Between Upper and Lower Parts
-st.markdown("---")
 # -----
 # Vega:
-st.subheader("ν (Vega): Sensitivity to Volatility")
-st.write("Vega represents the sensitivity of an option’s price to changes in the volatility of the underlying asset. A higher Vega implies that the option is more responsive to volatility shifts, which is particularly relevant for long-dated or at-the-money options.")
-st.markdown("---")
-
-# Create Meshgrid Object for Spot Prices & Volatilities
-X, Y = meshgrid(spot_price_min, volatility_min, spot_price_max, volatility_max)
-
-# Create a Model for Vega Sensitivies
-vega_model = bsm.BSM(X, strike_price, rf_rate, maturity_time, Y)
-
-# Calculate Call & Put Vega
-call_vegas = vega_model.theta_call()
-put_vegas = vega_model.theta_put()
+elif greek == "Vega":
+    st.subheader("ν (Vega): Sensitivity to Volatility")
+    st.write("Vega represents the sensitivity of an option’s price to changes in the volatility of the underlying asset. A higher Vega implies that the option is more responsive to volatility shifts, which is particularly relevant for long-dated or at-the-money options.")
+    st.markdown("---")
 
-# Create Vegas Heatmap
-fig = heatmap(X, Y, call_vegas, put_vegas, "Call Option Vega Heatmap", "Put Option Vega Heatmap", "Call Vega", "Put Vega", "Spot Price", "Volatility")
-st.pyplot(fig)
+    # Create Vegas Heatmap
+    fig = vega_fig(spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time)
+    st.pyplot(fig, clear_figure=False)
 
-# Add Small Break Between Upper and Lower Parts
-st.markdown("---")
 # -----
 # rho:
-st.subheader("ρ (Rho): Sensitivity to Interest Rate Changes")
-st.write("Rho quantifies the sensitivity of the option's price to changes in the risk-free interest rate. It is most relevant for long-dated options and reflects how discounting and forward pricing influence option valuation.")
-st.markdown("---")
-
-# Create Meshgrid Object for Spot Prices & Volatilities
-X, Y = meshgrid(spot_price_min, rf_rate_min, spot_price_max, rf_rate_max)
-
-# Create a Model for Rho Sensitivies
-rho_model = bsm.BSM(X, strike_price, Y, maturity_time, volatility)
-
-# Calculate Call & Put Rho
-call_rhos = rho_model.rho_call()
-put_rhos = rho_model.rho_put()
+elif greek == "Rho":
+    st.subheader("ρ (Rho): Sensitivity to Interest Rate Changes")
+    st.write("Rho quantifies the sensitivity of the option's price to changes in the risk-free interest rate. It is most relevant for long-dated options and reflects how discounting and forward pricing influence option valuation.")
+    st.markdown("---")
 
-# Create Rho Heatmap
-fig = heatmap(X, Y, call_rhos, put_rhos, "Call Option Rho Heatmap", "Put Option Rho Heatmap", "Call Rho", "Put Rho", "Spot Price", "Risk-Free Interest Rate")
-st.pyplot(fig)
+    # Create Rho Heatmap
+    fig = rho_fig(spot_price_min, spot_price_max, rf_rate_min, rf_rate_max, strike_price, maturity_time, volatility)
+    st.pyplot(fig, clear_figure=False)
+
+# Prefetch the Remaining Heatmap Surfaces After the Selected Panel is Drawn, and Only When the Worker Pool
+# is Idle: Rapid Slider Changes (from Any Session) Skip the Prefetch Rather than Queueing Stale Work. A Prefetch
+# Already in Flight Can Still Delay the Next Selected Surface by the Kernel Passes it Has Left
+if not pending():
+    spot_volatility_greeks(spot_price_min, spot_price_max, volatility_min, volatility_max, strike_price, rf_rate, maturity_time)
+    spot_maturity_greeks(spot_price_min, spot_price_max, maturity_time_min, maturity_time_max, strike_price, rf_rate, volatility)
+    spot_rate_greeks(spot_price_min, spot_price_max, rf_rate_min, rf_rate_max, strike_price, maturity_time, volatility)